@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
+import bisect
 import threading
 
 from horovod.run.common.util import network
@@ -68,11 +69,10 @@ class BasicDriverService(network.BasicService):
                           'This is not supported. Is the server behind NAT?'
                           ''.format(index=req.index, task_addresses=req.task_addresses,
                                     source=client_address[0]))
-                # Make host hash -> indices map.
+                # Make host hash -> indices map, keeping indices sorted on insert.
                 if req.host_hash not in self._task_host_hash_indices:
                     self._task_host_hash_indices[req.host_hash] = []
-                self._task_host_hash_indices[req.host_hash].append(req.index)
-                self._task_host_hash_indices[req.host_hash].sort()
+                bisect.insort(self._task_host_hash_indices[req.host_hash], req.index)
             finally:
                 self._wait_cond.notify_all()
                 self._wait_cond.release()
@@ -51,7 +51,8 @@ class WaitForCommandExitCodeRequest(object):
 
     def __init__(self, delay):
         """
-        :param delay: delay in seconds
+        :param delay: delay in seconds, sub-second values are supported,
+                      non-positive values wait for termination notification only
         :type delay: float
         """
         self.delay = delay
@@ -84,13 +85,23 @@ class BasicTaskService(network.BasicService):
         self._command_env = command_env
         self._command_abort = None
         self._command_exit_code = None
+        self._command_terminated = False
         self._verbose = verbose
 
         self._command_thread = None
         self._fn_result = None
 
     def _run_command(self, command, env, event):
-        self._command_exit_code = safe_shell_exec.execute(command, env=env, events=[event])
+        try:
+            self._command_exit_code = safe_shell_exec.execute(command, env=env, events=[event])
+        finally:
+            # wake up requests waiting for the command to terminate
+            self._wait_cond.acquire()
+            try:
+                self._command_terminated = True
+            finally:
+                self._wait_cond.notify_all()
+                self._wait_cond.release()
 
     def _add_envs(self, env, extra_env):
         """
@@ -136,12 +147,13 @@ class BasicTaskService(network.BasicService):
             return network.AckResponse()
 
         if isinstance(req, AbortCommandRequest):
+            # No waiter depends on the abort itself, they are woken up by
+            # _run_command once the aborted command terminates.
             self._wait_cond.acquire()
             try:
                 if self._command_thread is not None:
                     self._command_abort.set()
             finally:
-                self._wait_cond.notify_all()
                 self._wait_cond.release()
             return network.AckResponse()
 
@@ -157,8 +169,7 @@ class BasicTaskService(network.BasicService):
         if isinstance(req, CommandExitCodeRequest):
             self._wait_cond.acquire()
             try:
-                terminated = (self._command_thread is not None and
-                              not self._command_thread.is_alive())
+                terminated = self._command_terminated
                 return CommandExitCodeResponse(terminated,
                                                self._command_exit_code if terminated else None)
             finally:
@@ -167,8 +178,9 @@ class BasicTaskService(network.BasicService):
         if isinstance(req, WaitForCommandExitCodeRequest):
             self._wait_cond.acquire()
             try:
-                while self._command_thread is None or self._command_thread.is_alive():
-                    self._wait_cond.wait(req.delay if req.delay >= 1.0 else 1.0)
+                # _run_command notifies us on termination, the delay only bounds each wait
+                while not self._command_terminated:
+                    self._wait_cond.wait(req.delay if req.delay > 0 else None)
                 return WaitForCommandExitCodeResponse(self._command_exit_code)
             finally:
                 self._wait_cond.release()
@@ -256,5 +268,5 @@ class BasicTaskClient(network.BasicClient):
         try:
             resp = self._send(WaitForCommandExitCodeRequest(delay))
             return resp.exit_code
-        except:
+        except Exception:
             pass
@@ -232,7 +232,7 @@ class BasicClient(object):
                 finally:
                     rfile.close()
                     wfile.close()
-            except:
+            except Exception:
                 pass
             finally:
                 sock.close()
@@ -251,7 +251,7 @@ class BasicClient(object):
                 finally:
                     rfile.close()
                     wfile.close()
-            except:
+            except Exception:
                 if iter == self._attempts - 1:
                     # Raise exception on the last retry.
                     raise
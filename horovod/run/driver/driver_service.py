@@ -158,16 +158,22 @@ def _driver_fn(all_host_names, local_host_names, settings):
         if settings.verbose >= 2:
             print('Waiting for the hosts to acknowledge.')
         driver.wait_for_initial_registration(settings.timeout)
-        tasks = [
-            task_service.HorovodRunTaskClient(
+
+        def notify_initial_registration_complete(index):
+            task = task_service.HorovodRunTaskClient(
                 index,
                 driver.task_addresses_for_driver(index),
                 settings.key,
-                settings.verbose) for index in range(
-                settings.num_hosts)]
-        # Notify all the drivers that the initial registration is complete.
-        for task in tasks:
+                settings.verbose)
             task.notify_initial_registration_complete()
+
+        # Notify all the drivers that the initial registration is complete.
+        # Each client probes the task's addresses before it sends the
+        # notification, so contact all hosts concurrently rather than paying
+        # for these round-trips one host after the other.
+        threads.execute_function_multithreaded(
+            notify_initial_registration_complete,
+            [[index] for index in range(settings.num_hosts)])
         if settings.verbose >= 2:
             print('Notified all the hosts that the registration is complete.')
         # Each worker should probe the interfaces of the next worker in a ring
@@ -69,11 +69,6 @@ def _allocate(hosts, np):
     :rtype: list[dict()]
     """
 
-    host_list = []
-    # split the host string to host list
-    for host_item in hosts.split(','):
-        host_list.append(HostInfo(host_item))
-
     rank = 0
     alloc_list = []
 
@@ -82,8 +77,9 @@ def _allocate(hosts, np):
     # key: cross_rank; value: local_size for this cross_rank
     cross_sizes = collections.defaultdict(int)
 
-    # allocate processes into slots
-    for host_idx, host_info in enumerate(host_list):
+    # split the host string and allocate processes into slots in a single pass
+    for host_idx, host_item in enumerate(hosts.split(',')):
+        host_info = HostInfo(host_item)
         for local_rank in range(host_info.slots):
             if rank == np:
                 break
@@ -119,7 +119,10 @@ class RendezvousHandler(KVStoreHandler):
         _, scope, key = paths
 
         with self.server.finished_list_lock:
-            self.server.finished_list[scope].append(key)
+            finished_list = self.server.finished_list[scope]
+            finished_list.append(key)
+            if len(finished_list) >= self.server.scope_size.get(scope, 0):
+                self.server.unfinished_scopes.discard(scope)
 
         self.send_status_code(OK)
 
@@ -137,6 +140,9 @@ class RendezvousHTTPServer(BaseHTTPServer.HTTPServer, object):
         # Total size for scopes
         self.scope_size = {}
 
+        # Scopes that still expect finalize messages, guarded by finished_list_lock
+        self.unfinished_scopes = set()
+
         # Cache that provides the store
         self.cache_lock = threading.Lock()
         self.cache = {}
@@ -151,14 +157,17 @@ class RendezvousHTTPServer(BaseHTTPServer.HTTPServer, object):
             local_rank = slot_info.local_rank
             self.scope_size['cross_' + str(local_rank)] = slot_info.cross_size
 
+        with self.finished_list_lock:
+            self.unfinished_scopes = set(
+                scope for scope, cnt in self.scope_size.items()
+                if cnt > len(self.finished_list[scope]))
+
     # Decide whether all ranks have confirmed rendezvous completion.
+    # This is checked before every request, so it only tests the precomputed
+    # set of unfinished scopes rather than counting all scopes.
     def should_continue(self):
-        should_continue = False
         with self.finished_list_lock:
-            for scope, cnt in self.scope_size.items():
-                if cnt > len(self.finished_list[scope]):
-                    should_continue = True
-        return should_continue
+            return len(self.unfinished_scopes) > 0
 
     def handle_timeout(self):
         error_msg = 'Rendezvous ERROR: Rendezvous server timeout after ' \
@@ -53,6 +53,8 @@ class Cache(object):
         self._cache_staleness_threshold = \
             datetime.timedelta(minutes=cache_staleness_threshold_in_minutes)
         self._lock = threading.Lock()
+        # serializes dumps so an older snapshot never overwrites a newer one
+        self._dump_lock = threading.Lock()
 
     def get(self, key):
         self._lock.acquire()
@@ -66,12 +68,19 @@ class Cache(object):
             return None
 
     def put(self, key, val):
-        self._lock.acquire()
-        self._content[key] = (datetime.datetime.now(), val)
+        self._dump_lock.acquire()
         try:
-            self._dump(self._content)
+            self._lock.acquire()
+            try:
+                self._content[key] = (datetime.datetime.now(), val)
+                content = self._content.copy()
+            finally:
+                self._lock.release()
+
+            # writing the cache file does not block readers
+            self._dump(content)
         finally:
-            self._lock.release()
+            self._dump_lock.release()
 
     def _dump(self, content):
         with open(self._cache_file, 'wb') as cf:
@@ -42,22 +42,31 @@ def execute_function_multithreaded(fn,
         }
     :rtype: dict
     """
-    result_queue = queue.Queue()
+    # results are only collected once all threads are done, so a plain dict
+    # guarded by a lock suffices, no need for a queue
+    results = {}
+    results_lock = threading.Lock()
     worker_queue = queue.Queue()
+    # set whenever a thread terminates, so finished threads are reaped right away
+    thread_done = threading.Event()
 
     for i, arg in enumerate(args_list):
         arg.append(i)
         worker_queue.put(arg)
 
     def fn_execute():
-        while True:
-            try:
-                arg = worker_queue.get(block=False)
-            except queue.Empty:
-                return
-            exec_index = arg[-1]
-            res = fn(*arg[:-1])
-            result_queue.put((exec_index, res))
+        try:
+            while True:
+                try:
+                    arg = worker_queue.get(block=False)
+                except queue.Empty:
+                    return
+                exec_index = arg[-1]
+                res = fn(*arg[:-1])
+                with results_lock:
+                    results[exec_index] = res
+        finally:
+            thread_done.set()
 
     threads = []
     number_of_threads = min(max_concurrent_executions, len(args_list))
@@ -67,29 +76,24 @@ def execute_function_multithreaded(fn,
         threads.append(thread)
 
     # Returns the results only if block_until_all_done is set.
-    results = None
     if block_until_all_done:
 
-        # Because join() cannot be interrupted by signal, a single join()
-        # needs to be separated into join()s with timeout in a while loop.
-        have_alive_child = True
-        while have_alive_child:
-            have_alive_child = False
-            for t in threads:
-                t.join(0.1)
-                if t.is_alive():
-                    have_alive_child = True
-
-        results = {}
-        while not result_queue.empty():
-            item = result_queue.get()
-            results[item[0]] = item[1]
+        # Because join() cannot be interrupted by signal, we wait for any
+        # thread to finish with a timeout in a while loop. Threads are reaped
+        # in the order they finish, so a long running thread does not delay
+        # noticing that all other threads are done.
+        pending = threads
+        while pending:
+            thread_done.wait(0.1)
+            thread_done.clear()
+            pending = [t for t in pending if t.is_alive()]
 
         if len(results) != len(args_list):
             raise RuntimeError(
                 'Some threads for func {func} did not complete '
                 'successfully.'.format(func=fn.__name__))
-    return results
+        return results
+    return None
 
 
 def in_thread(target, args=(), name=None, daemon=True, silent=False):
@@ -110,7 +114,7 @@ def in_thread(target, args=(), name=None, daemon=True, silent=False):
         def fn(*args):
             try:
                 target(*args)
-            except:
+            except Exception:
                 pass
     else:
         fn = target
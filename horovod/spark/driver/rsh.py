@@ -65,7 +65,7 @@ def rsh(driver_addresses, key, settings, host_hash, command, env, local_rank,
 
         try:
             return task_client.wait_for_command_exit_code()
-        except:
+        except Exception:
             traceback.print_exc()
             return -1
         finally:
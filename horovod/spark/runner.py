@@ -46,9 +46,11 @@ def _task_fn(index, driver_addresses, key, settings, use_gloo):
     task = task_service.SparkTaskService(index, settings.key, settings.nics, settings.verbose)
     try:
         driver_client = driver_service.SparkDriverClient(driver_addresses, settings.key, settings.verbose)
-        driver_client.register_task(index, task.addresses(), host_hash.host_hash())
+        # the host hash reads /proc and hashes host information, compute it only once
+        task_host_hash = host_hash.host_hash()
+        driver_client.register_task(index, task.addresses(), task_host_hash)
         task.wait_for_initial_registration(settings.timeout)
-        task_indices_on_this_host = driver_client.task_host_hash_indices(host_hash.host_hash())
+        task_indices_on_this_host = driver_client.task_host_hash_indices(task_host_hash)
 
         # With Gloo all tasks wait for the command
         # With MPI task with first index executes orted which will run mpirun_exec_fn for all tasks.
@@ -43,7 +43,7 @@ from horovod.run.mpi_run import _get_mpi_implementation, _get_mpi_implementation
     _LARGE_CLUSTER_THRESHOLD as large_cluster_threshold, mpi_available, mpi_run,\
     _OMPI_IMPL, _SMPI_IMPL, _MPICH_IMPL, _UNKNOWN_IMPL, _MISSING_IMPL
 from horovod.run.runner import parse_args, parse_host_files, run_controller, HorovodArgs, _run
-from horovod.run.util.threads import in_thread, on_event
+from horovod.run.util.threads import execute_function_multithreaded, in_thread, on_event
 
 from common import is_built, lsf_and_jsrun, override_args, override_env, temppath, delay, wait
 
@@ -223,6 +223,26 @@ class RunTests(unittest.TestCase):
             with pytest.raises(ValueError):
                 parse_args()
 
+    def test_execute_function_multithreaded(self):
+        def fn(value):
+            return value * 2
+
+        args_list = [[value] for value in range(10)]
+        res = execute_function_multithreaded(fn, args_list, max_concurrent_executions=3)
+        self.assertEqual({index: index * 2 for index in range(10)}, res)
+
+        res = execute_function_multithreaded(fn, [[1]], block_until_all_done=False)
+        self.assertIsNone(res)
+
+        def fail(value):
+            if value == 3:
+                raise Exception("Test Exception")
+            return value
+
+        with pytest.raises(RuntimeError, match="^Some threads for func fail did not complete "
+                                               "successfully.$"):
+            execute_function_multithreaded(fail, [[value] for value in range(5)])
+
     # test_on_event tests in_thread as well, but it does not test args
     def test_in_thread_args(self):
         fn = mock.Mock()
@@ -151,3 +151,14 @@ class NetworkTests(unittest.TestCase):
         client.run_command('false', {})
         res = client.wait_for_command_exit_code()
         self.assertEqual(1, res)
+
+    def test_exit_code_sub_second_delay(self):
+        """test waiting for exit code with sub-second and non-positive delays"""
+        key = secret.make_secret_key()
+        service_name = 'test-service'
+        service = BasicTaskService(service_name, key, nics=None, verbose=2)
+        client = BasicTaskClient(service_name, service.addresses(), key, verbose=2, attempts=1)
+
+        client.run_command('sleep 0.5; exit 3', {})
+        self.assertEqual(3, client.wait_for_command_exit_code(0.1))
+        self.assertEqual(3, client.wait_for_command_exit_code(0))